@@ -1,12 +1,20 @@
+import time
+STARTUP_BEGIN = time.perf_counter()
+
 from flask import Flask, render_template, request, jsonify
 from flask_sqlalchemy import SQLAlchemy
-import json
+from werkzeug.middleware.proxy_fix import ProxyFix
 import os
 import logging
+import math
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from sqlalchemy import desc
 
 app = Flask(__name__)
+# Trust the single X-Forwarded-For hop appended by the ALB so remote_addr is the real client
+app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1)
 
 # Database configuration
 db_host = os.getenv('DB_HOST', 'localhost')
@@ -18,6 +26,17 @@ db_password = os.getenv('DB_PASSWORD', 'ChangeMe123!')
 app.config['SQLALCHEMY_DATABASE_URI'] = f'postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# Keep the pool small and fail fast when it is exhausted; MAX_IN_FLIGHT defaults to its capacity
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '10'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '0'))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '2'))
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': DB_POOL_SIZE,
+    'max_overflow': DB_MAX_OVERFLOW,
+    'pool_timeout': DB_POOL_TIMEOUT,
+    'pool_pre_ping': True,
+}
+
 db = SQLAlchemy(app)
 
 # Configure logging
@@ -28,13 +47,90 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Log startup
-logger.info("=" * 60)
-logger.info("Tic-Tac-Toe Application Starting")
-logger.info("=" * 60)
-logger.info(f"Environment: {os.getenv('ENVIRONMENT', 'unknown')}")
-logger.info(f"Database Host: {os.getenv('DB_HOST', 'Not configured')}")
-logger.info(f"Database Name: {os.getenv('DB_NAME', 'Not configured')}")
-logger.info("=" * 60)
+logger.info(f"Tic-Tac-Toe Application Starting (environment={os.getenv('ENVIRONMENT', 'unknown')}, "
+            f"db_host={os.getenv('DB_HOST', 'Not configured')}, db_name={os.getenv('DB_NAME', 'Not configured')})")
+
+# Admission control configuration
+RATE_LIMIT_PER_SECOND = float(os.getenv('RATE_LIMIT_PER_SECOND', '10'))
+RATE_LIMIT_BURST = float(os.getenv('RATE_LIMIT_BURST', '20'))
+MAX_IN_FLIGHT = int(os.getenv('MAX_IN_FLIGHT', str(DB_POOL_SIZE + DB_MAX_OVERFLOW)))
+RATE_LIMIT_MAX_CLIENTS = 10000
+
+# A rate of 0 disables per-client limiting; anything else must be usable as a divisor
+if RATE_LIMIT_PER_SECOND < 0:
+    raise ValueError(f"RATE_LIMIT_PER_SECOND must be >= 0, got {RATE_LIMIT_PER_SECOND}")
+if RATE_LIMIT_PER_SECOND > 0 and RATE_LIMIT_BURST < 1:
+    raise ValueError(f"RATE_LIMIT_BURST must be >= 1, got {RATE_LIMIT_BURST}")
+if MAX_IN_FLIGHT < 1:
+    raise ValueError(f"MAX_IN_FLIGHT must be >= 1, got {MAX_IN_FLIGHT}")
+
+# Only these DB-free probes bypass admission control; /ready hits the database and is admitted like any request
+EXEMPT_PATHS = frozenset(['/health', '/healthz', '/live'])
+
+class TokenBucketLimiter:
+    """Per-client token bucket with a hard cap on tracked clients (least recently seen are evicted)"""
+
+    def __init__(self, rate, burst, max_clients=RATE_LIMIT_MAX_CLIENTS):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self.buckets = OrderedDict()
+        self.lock = threading.Lock()
+
+    def acquire(self, key):
+        """Take a token for key; returns seconds to wait, or 0 if allowed"""
+        now = time.monotonic()
+        with self.lock:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                tokens, last = self.burst, now
+                if len(self.buckets) >= self.max_clients:
+                    self.buckets.popitem(last=False)
+            else:
+                tokens, last = bucket
+                self.buckets.move_to_end(key)
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens >= 1:
+                self.buckets[key] = (tokens - 1, now)
+                return 0
+            self.buckets[key] = (tokens, now)
+            return (1 - tokens) / self.rate
+
+rate_limiter = TokenBucketLimiter(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST) if RATE_LIMIT_PER_SECOND > 0 else None
+in_flight = threading.BoundedSemaphore(MAX_IN_FLIGHT)
+
+def client_key():
+    """Identify the caller by client IP (resolved by ProxyFix from the ALB-appended hop)"""
+    return f"ip:{request.remote_addr}"
+
+def reject(status, message, retry_after):
+    response = jsonify({"error": message})
+    response.status_code = status
+    response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+    return response
+
+@app.before_request
+def admission_control():
+    if request.path in EXEMPT_PATHS or request.path.startswith('/static/'):
+        return None
+
+    if rate_limiter:
+        key = client_key()
+        wait = rate_limiter.acquire(key)
+        if wait:
+            logger.debug(f"Rate limit exceeded for {key}")
+            return reject(429, "Too many requests", wait)
+
+    if not in_flight.acquire(blocking=False):
+        logger.debug("Server busy: in-flight request limit reached")
+        return reject(503, "Server busy", 1)
+    request.environ['app.in_flight_slot'] = True
+    return None
+
+@app.teardown_request
+def release_in_flight(exc=None):
+    if request.environ.pop('app.in_flight_slot', False):
+        in_flight.release()
 
 # Database Models
 class Player(db.Model):
@@ -79,6 +175,9 @@ class Game(db.Model):
             'duration_seconds': self.duration_seconds
         }
 
+# Set once the database schema exists; /health and /ready stay 503 until then
+schema_ready = threading.Event()
+
 # Initialize game state
 game_state = {
     "board": [""] * 9,
@@ -113,6 +212,8 @@ def index():
 def health():
     """Health check endpoint for ALB"""
     logger.debug("Health check request received")
+    if not schema_ready.is_set():
+        return jsonify({"status": "starting", "service": "tic-tac-toe-app"}), 503
     return jsonify({"status": "healthy", "service": "tic-tac-toe-app"}), 200
 
 @app.route('/healthz')
@@ -131,6 +232,8 @@ def live():
 def ready():
     """Readiness probe - is the app ready to serve requests?"""
     logger.debug("Readiness probe check")
+    if not schema_ready.is_set():
+        return jsonify({"ready": False, "error": "Database schema not initialized"}), 503
     try:
         # Try to connect to database
         db.session.execute('SELECT 1')
@@ -316,12 +419,33 @@ def reset():
     logger.info("Game reset")
     return jsonify(game_state), 200
 
-if __name__ == '__main__':
+def init_db():
+    """Create tables off the serving thread, retrying until the database is reachable"""
+    started = time.perf_counter()
+    delay = 1
     with app.app_context():
-        try:
-            db.create_all()
-            logger.info("Database tables initialized")
-        except Exception as e:
-            logger.warning(f"Could not initialize database: {str(e)}")
-    
-    app.run(host='0.0.0.0', port=5000, debug=False)
\ No newline at end of file
+        while True:
+            try:
+                db.create_all()
+                break
+            except Exception as e:
+                logger.warning(f"Could not initialize database, retrying in {delay}s: {str(e)}")
+                time.sleep(delay)
+                delay = min(delay * 2, 30)
+    schema_ready.set()
+    logger.info(f"Startup timing: database tables initialized in {(time.perf_counter() - started) * 1000:.0f} ms, "
+                f"healthy {(time.perf_counter() - STARTUP_BEGIN) * 1000:.0f} ms after process start")
+
+# Start schema init at import so every entry point (app.main(), gunicorn, flask run, tests) gets it
+if os.getenv('INIT_DB', 'true').lower() == 'true':
+    threading.Thread(target=init_db, name='init-db', daemon=True).start()
+else:
+    # Schema is managed outside the app (e.g. a one-off migration task)
+    schema_ready.set()
+
+def main():
+    logger.info(f"Startup timing: imports/app init took {(time.perf_counter() - STARTUP_BEGIN) * 1000:.0f} ms")
+    app.run(host='0.0.0.0', port=int(os.getenv('PORT', '5000')), debug=False)
+
+if __name__ == '__main__':
+    main()
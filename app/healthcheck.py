@@ -0,0 +1,17 @@
+"""Container liveness check - replaces curl so the image doesn't need it
+
+Hits /live rather than /health so the container check itself doesn't fail
+while init_db() waits on the database. ALB-driven replacement of such tasks
+is held off by the ECS service's health check grace period.
+"""
+import os
+import sys
+import urllib.request
+
+port = os.getenv('PORT', '5000')
+
+try:
+    with urllib.request.urlopen(f'http://localhost:{port}/live', timeout=3) as response:
+        sys.exit(0 if response.status == 200 else 1)
+except Exception:
+    sys.exit(1)
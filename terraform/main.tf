@@ -334,7 +334,7 @@ resource "aws_lb_target_group" "app" {
     healthy_threshold   = 2
     unhealthy_threshold = 2
     timeout             = 3
-    interval            = 30
+    interval            = 5
     path                = "/health"
     matcher             = "200"
   }
@@ -437,6 +437,30 @@ resource "aws_ecs_task_definition" "app" {
           name  = "DB_PORT"
           value = "5432"
         },
+        {
+          name  = "PORT"
+          value = tostring(var.container_port)
+        },
+        {
+          name  = "RATE_LIMIT_PER_SECOND"
+          value = tostring(var.rate_limit_per_second)
+        },
+        {
+          name  = "RATE_LIMIT_BURST"
+          value = tostring(var.rate_limit_burst)
+        },
+        {
+          name  = "MAX_IN_FLIGHT"
+          value = tostring(var.max_in_flight)
+        },
+        {
+          name  = "DB_POOL_SIZE"
+          value = tostring(var.db_pool_size)
+        },
+        {
+          name  = "DB_POOL_TIMEOUT"
+          value = tostring(var.db_pool_timeout)
+        },
         {
           name  = "DB_NAME"
           value = var.db_name
@@ -464,11 +488,11 @@ resource "aws_ecs_task_definition" "app" {
       }
 
       healthCheck = {
-        command     = ["CMD-SHELL", "curl -f http://localhost:${var.container_port}/health || exit 1"]
-        interval    = 30
+        command     = ["CMD", "python", "healthcheck.py"]
+        interval    = 10
         timeout     = 5
         retries     = 2
-        startPeriod = 60
+        startPeriod = 10
       }
     }
   ])
@@ -507,6 +531,9 @@ resource "aws_ecs_service" "app" {
   desired_count   = var.desired_task_count
   launch_type     = "FARGATE"
 
+  # ALB checks run every 5s; give new tasks time for init_db() to reach RDS before unhealthy targets are replaced
+  health_check_grace_period_seconds = var.health_check_grace_period
+
   network_configuration {
     subnets          = aws_subnet.private[*].id
     security_groups  = [aws_security_group.ecs_tasks.id]
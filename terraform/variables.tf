@@ -174,6 +174,54 @@ variable "container_port" {
   default     = 5000
 }
 
+variable "health_check_grace_period" {
+  description = "Seconds ECS ignores ALB health checks on new tasks (covers the longest expected database wait)"
+  type        = number
+  default     = 60
+}
+
+variable "rate_limit_per_second" {
+  description = "Per-client request rate allowed by the app (0 disables per-client limiting)"
+  type        = number
+  default     = 10
+  validation {
+    condition     = var.rate_limit_per_second >= 0
+    error_message = "Rate limit must be >= 0."
+  }
+}
+
+variable "rate_limit_burst" {
+  description = "Per-client burst size for the app rate limiter"
+  type        = number
+  default     = 20
+  validation {
+    condition     = var.rate_limit_burst >= 1
+    error_message = "Rate limit burst must be >= 1."
+  }
+}
+
+variable "max_in_flight" {
+  description = "Maximum concurrent requests admitted per task (keep at or below db_pool_size)"
+  type        = number
+  default     = 10
+  validation {
+    condition     = var.max_in_flight >= 1
+    error_message = "Max in-flight requests must be >= 1."
+  }
+}
+
+variable "db_pool_size" {
+  description = "Database connection pool size per task"
+  type        = number
+  default     = 10
+}
+
+variable "db_pool_timeout" {
+  description = "Seconds a request waits for a pooled database connection before failing"
+  type        = number
+  default     = 2
+}
+
 variable "task_cpu" {
   description = "Fargate task CPU units (256, 512, 1024, etc.)"
   type        = number